@@ -4,6 +4,14 @@ import re
 import subprocess
 import sys
 
+_VERSION_RE = re.compile(r'version = "([^"]+)"')
+_PROJECT_VERSION_RE = re.compile(
+    r'(\[project\].*?)^version = "[^"]+"', re.MULTILINE | re.DOTALL
+)
+_RELEASE_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+(?:rc\d+)?$")
+
+PYPROJECT_PATH = Path("pyproject.toml")
+
 
 def run_command(command, description, check=True):
     """Run a command and handle errors."""
@@ -25,15 +33,18 @@ def run_command(command, description, check=True):
         return None
 
 
-def get_current_version():
-    """Get current version from pyproject.toml."""
-    pyproject_path = Path("pyproject.toml")
-    if not pyproject_path.exists():
+def read_pyproject():
+    """Read pyproject.toml, returning None if it does not exist."""
+    if not PYPROJECT_PATH.exists():
         print("Error: pyproject.toml not found")
         return None
 
-    content = pyproject_path.read_text()
-    match = re.search(r'version = "([^"]+)"', content)
+    return PYPROJECT_PATH.read_text()
+
+
+def get_current_version(content):
+    """Get current version from pyproject.toml content."""
+    match = _VERSION_RE.search(content)
     if match:
         return match.group(1)
 
@@ -41,24 +52,16 @@ def get_current_version():
     return None
 
 
-def update_version(new_version):
-    """Update version in pyproject.toml."""
-    pyproject_path = Path("pyproject.toml")
-    content = pyproject_path.read_text()
-
+def update_version(content, new_version):
+    """Update version in pyproject.toml content and write it back."""
     # Update version - only the main project version in [project] section
-    updated_content = re.sub(
-        r'(\[project\].*?)^version = "[^"]+"',
-        rf'\1version = "{new_version}"',
-        content,
-        flags=re.MULTILINE | re.DOTALL
-    )
+    updated_content = _PROJECT_VERSION_RE.sub(rf'\1version = "{new_version}"', content)
 
     if content == updated_content:
         print("Error: Could not update version in pyproject.toml")
         return False
 
-    pyproject_path.write_text(updated_content)
+    PYPROJECT_PATH.write_text(updated_content)
     print(f"Updated version to {new_version} in pyproject.toml")
     return True
 
@@ -66,19 +69,34 @@ def update_version(new_version):
 def validate_version(version):
     """Validate version format."""
     # Simple semantic version validation
-    pattern = r"^\d+\.\d+\.\d+(?:rc\d+)?$"
-    return re.match(pattern, version) is not None
+    return _RELEASE_VERSION_RE.match(version) is not None
 
 
-def check_git_status():
-    """Check if git working directory is clean."""
-    result = run_command(
-        ["git", "status", "--porcelain"], "Checking git status", check=False
-    )
-    if result is None:
+def start_git_status():
+    """Start `git status --porcelain` without waiting for it to finish."""
+    print("Running: Checking git status")
+    try:
+        return subprocess.Popen(
+            ["git", "status", "--porcelain"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except FileNotFoundError:
+        print("Error: Command not found: git")
+        return None
+
+
+def check_git_status(process):
+    """Wait for a started git status and check the working directory is clean."""
+    if process is None:
         return False
 
-    if result.stdout.strip():
+    stdout, stderr = process.communicate()
+    if stderr.strip():
+        print("Error output:", stderr.strip())
+
+    if stdout.strip():
         print(
             "Error: Git working directory is not clean. Please commit or stash changes."
         )
@@ -94,14 +112,19 @@ def create_release(version, dry_run=False):
         print("Version should be in format: X.Y.Z or X.Y.ZrcN")
         return False
 
-    current_version = get_current_version()
+    # git status runs in the background while pyproject.toml is read
+    status_process = start_git_status()
+    content = read_pyproject()
+    current_version = get_current_version(content) if content is not None else None
+    git_clean = check_git_status(status_process)
+
     if not current_version:
         return False
 
     print(f"Current version: {current_version}")
     print(f"New version: {version}")
 
-    if not check_git_status():
+    if not git_clean:
         return False
 
     if dry_run:
@@ -114,16 +137,12 @@ def create_release(version, dry_run=False):
         return True
 
     # Update version
-    if not update_version(version):
-        return False
-
-    # Commit version update
-    result = run_command(["git", "add", "pyproject.toml"], "Staging pyproject.toml")
-    if not result:
+    if not update_version(content, version):
         return False
 
+    # Commit version update; passing the path stages and commits it in one step
     result = run_command(
-        ["git", "commit", "-m", f"Bump version to {version}"],
+        ["git", "commit", "-m", f"Bump version to {version}", "--", "pyproject.toml"],
         "Committing version update",
     )
     if not result:
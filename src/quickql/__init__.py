@@ -1,3 +1,3 @@
-from .builder import Query
+from .builder import Query, QueryTemplate
 
-__all__ = ["Query"]
+__all__ = ["Query", "QueryTemplate"]
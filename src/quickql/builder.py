@@ -1,7 +1,41 @@
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+import re
+import sys
 import textwrap
-from typing import Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+# Prefix applied to every line of a clause body
+INDENT = " " * 4
+
+# Normalized identifiers matching this pattern are interned
+_IDENTIFIER_RE = re.compile(r"[\w.]+")
+_MAX_INTERNED_LENGTH = 64
+
+# DB-API paramstyles supported by QueryTemplate.bind(), mapped to the marker
+# each placeholder is rewritten to; qmark and format take positional values
+_PARAMSTYLES = {
+    "named": ":{}",
+    "pyformat": "%({})s",
+    "qmark": "?",
+    "format": "%s",
+}
 
 
 class SQLKeyword(Enum):
@@ -24,9 +58,23 @@ class SQLFlag(Enum):
     ALL = "ALL"
 
 
-@dataclass
+# Elements for one clause, as accepted by Query.from_spec(): a single string,
+# or a list/tuple of elements in which (alias, value) pairs are nested
+ClauseElements = Union[str, Sequence[Union[str, tuple]]]
+
+# Clause keywords as interned plain strings, in the order they are rendered
+KEYWORDS: Tuple[str, ...] = tuple(sys.intern(keyword.value) for keyword in SQLKeyword)
+_KEYWORD_SET = frozenset(KEYWORDS)
+
+
+@dataclass(slots=True)
 class QueryElement:
-    """Represents a single element in a SQL query (column, table, condition, etc.)."""
+    """
+    Represents a single element in a SQL query (column, table, condition, etc.).
+
+    Elements are treated as immutable once added to a clause: their SQL is
+    rendered at that point, so later changes to their fields are not built.
+    """
 
     value: str
     alias: str = ""
@@ -34,29 +82,117 @@ class QueryElement:
     is_subquery: bool = False
 
     @classmethod
-    def create(cls, arg: Union[str, tuple], **kwargs) -> "QueryElement":
-        """Create a QueryElement from various input formats."""
-        if isinstance(arg, str):
-            return cls(value=_normalize_sql(arg), **kwargs)
+    def create(
+        cls,
+        arg: Union[str, tuple],
+        join_keyword: str = "",
+        is_subquery: bool = False,
+    ) -> "QueryElement":
+        """
+        Create a QueryElement from various input formats.
+
+        Subquery values are stored already wrapped in indented parentheses, so
+        building the query does not redo the wrapping.
+        """
+        # Exact type checks cover the common str / 2-tuple inputs; subclasses
+        # and lists fall through to the isinstance checks below
+        if type(arg) is str:
+            alias, value = "", _normalize_sql(arg)
+        elif type(arg) is tuple and len(arg) == 2:
+            alias, value = _normalize_sql(arg[0]), _normalize_sql(arg[1])
+        elif isinstance(arg, str):
+            alias, value = "", _normalize_sql(arg)
         elif isinstance(arg, (list, tuple)) and len(arg) == 2:
-            alias, value = arg
-            return cls(
-                value=_normalize_sql(value), alias=_normalize_sql(alias), **kwargs
-            )
+            alias, value = _normalize_sql(arg[0]), _normalize_sql(arg[1])
         else:
             raise ValueError(f"Invalid argument format: {arg!r}")
 
+        if is_subquery:
+            value = f"(\n{_indent_text(value)}\n)"
+        return cls(value, alias, join_keyword, is_subquery)
+
+    @property
+    def sql(self) -> str:
+        """The element as rendered in its clause body."""
+        if not self.alias:
+            return self.value
+        if self.is_subquery:
+            # CTEs put the name first: ``alias AS (subquery)``
+            return f"{self.alias} AS {self.value}"
+        return f"{self.value} AS {self.alias}"
+
+
+class _ElementsView(Sequence[QueryElement]):
+    """A read-only view of a clause's element list, without copying it."""
+
+    __slots__ = ("_elements",)
+
+    def __init__(self, elements: List[QueryElement]) -> None:
+        self._elements = elements
+
+    @overload
+    def __getitem__(self, index: int) -> QueryElement: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[QueryElement]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[QueryElement, Sequence[QueryElement]]:
+        return self._elements[index]
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __iter__(self) -> Iterator[QueryElement]:
+        return iter(self._elements)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._elements!r})"
+
 
 class ClauseCollection:
-    """Manages a collection of query elements for a specific SQL clause."""
+    """
+    Manages a collection of query elements for a specific SQL clause.
+
+    Elements are only added through ``add_element``, which also records each
+    element's SQL text in ``_rendered``, in the same order, so building a
+    clause body is a single ``str.join`` over a list of strings.
+    ``has_joins`` records whether any element carries a JOIN keyword and so
+    needs grouping when rendered.
+    """
+
+    __slots__ = ("flag", "_rendered", "has_joins", "_elements")
 
-    def __init__(self):
-        self.elements: List[QueryElement] = []
+    def __init__(self) -> None:
         self.flag: Optional[str] = None
+        self._rendered: List[str] = []
+        self.has_joins = False
+        self._elements: List[QueryElement] = []
+
+    @property
+    def elements(self) -> Sequence[QueryElement]:
+        """A read-only view of the query elements in this clause."""
+        return _ElementsView(self._elements)
 
     def add_element(self, element: QueryElement) -> None:
-        """Add a query element to this clause."""
-        self.elements.append(element)
+        """Add a query element to this clause, rendering its SQL now.
+
+        The element must not be changed afterwards; see QueryElement.
+        """
+        self._elements.append(element)
+        self._rendered.append(element.sql)
+        if element.join_keyword:
+            self.has_joins = True
+
+    def copy(self) -> "ClauseCollection":
+        """Return a copy that can be extended without affecting this one."""
+        clone = ClauseCollection()
+        clone.flag = self.flag
+        clone._rendered = self._rendered.copy()
+        clone.has_joins = self.has_joins
+        clone._elements = self._elements.copy()
+        return clone
 
     def set_flag(self, flag: str) -> None:
         """Set a flag for this clause (e.g., DISTINCT for SELECT)."""
@@ -66,13 +202,13 @@ class ClauseCollection:
 
     def is_empty(self) -> bool:
         """Check if this clause has any elements."""
-        return len(self.elements) == 0
+        return not self._elements
 
-    def __iter__(self):
-        return iter(self.elements)
+    def __iter__(self) -> Iterator[QueryElement]:
+        return iter(self._elements)
 
-    def __len__(self):
-        return len(self.elements)
+    def __len__(self) -> int:
+        return len(self._elements)
 
 
 class Query:
@@ -83,39 +219,175 @@ class Query:
         query = QueryBuilder()
         query.SELECT("name", "email").FROM("users").WHERE("active = 1")
         print(str(query))  # Outputs formatted SQL
+
+    The class configuration below is read when the class is created and the
+    mappings are read-only. Customize it by overriding the attributes in a
+    subclass; changing them on an existing class would not affect builds.
     """
 
+    __slots__ = ("_clauses", "_cached_sql")
+
     # Configuration for how different clauses are formatted and separated
-    CLAUSE_SEPARATORS = {
-        SQLKeyword.WHERE: " AND ",
-        SQLKeyword.HAVING: " AND ",
-    }
+    CLAUSE_SEPARATORS: Mapping[str, str] = MappingProxyType(
+        {
+            SQLKeyword.WHERE.value: " AND ",
+            SQLKeyword.HAVING.value: " AND ",
+        }
+    )
 
     DEFAULT_SEPARATOR = ", "
 
     # Keywords that support flags
-    FLAGGABLE_KEYWORDS = {SQLKeyword.SELECT: {SQLFlag.DISTINCT, SQLFlag.ALL}}
+    FLAGGABLE_KEYWORDS: Mapping[str, FrozenSet[str]] = MappingProxyType(
+        {
+            SQLKeyword.SELECT.value: frozenset(
+                {SQLFlag.DISTINCT.value, SQLFlag.ALL.value}
+            )
+        }
+    )
 
     # Keywords that support subqueries
-    SUBQUERY_KEYWORDS = {SQLKeyword.WITH}
+    SUBQUERY_KEYWORDS: FrozenSet[str] = frozenset({SQLKeyword.WITH.value})
 
     # JOIN aliases that map to FROM clause
-    JOIN_ALIASES = {
-        "JOIN": "FROM",
-        "INNER JOIN": "FROM",
-        "LEFT JOIN": "FROM",
-        "RIGHT JOIN": "FROM",
-        "FULL JOIN": "FROM",
-        "CROSS JOIN": "FROM",
-    }
-
-    def __init__(self):
-        """Initialize a new query builder."""
-        self._clauses: Dict[SQLKeyword, ClauseCollection] = {
-            keyword: ClauseCollection() for keyword in SQLKeyword
+    JOIN_ALIASES: Mapping[str, str] = MappingProxyType(
+        {
+            "JOIN": "FROM",
+            "INNER JOIN": "FROM",
+            "LEFT JOIN": "FROM",
+            "RIGHT JOIN": "FROM",
+            "FULL JOIN": "FROM",
+            "CROSS JOIN": "FROM",
         }
+    )
+
+    # Resolved (clause, join keyword, flag, is_subquery) per clause name passed
+    # to add(); filled on first use so repeated names cost one dict lookup.
+    # Entries stay valid because the configuration above is read-only
+    _RESOLVED_CLAUSES: Dict[str, Tuple[str, str, str, bool]] = {}
+
+    # (keyword, separator) pairs in render order, set by _compile_layout()
+    _CLAUSE_LAYOUT: Tuple[Tuple[str, str], ...] = ()
+
+    # SELECT and FROM separators, for the SELECT ... FROM fast path in build()
+    _SELECT_FROM_SEPARATORS: Tuple[str, str] = (", ", ", ")
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Give subclasses their own resolution cache and layout, as they may
+        change the class configuration."""
+        super().__init_subclass__(**kwargs)
+        cls._RESOLVED_CLAUSES = {}
+        cls._normalize_config()
+        cls._compile_layout()
 
-    def add(self, clause_name: str, *args) -> "Query":
+    @classmethod
+    def _normalize_config(cls) -> None:
+        """Key the class configuration by SQL text.
+
+        Subclasses may name keywords and flags with SQLKeyword / SQLFlag
+        members or with plain strings; lookups always use the strings.
+        """
+        cls.CLAUSE_SEPARATORS = MappingProxyType(
+            {
+                _sql_text(keyword): separator
+                for keyword, separator in cls.CLAUSE_SEPARATORS.items()
+            }
+        )
+        cls.FLAGGABLE_KEYWORDS = MappingProxyType(
+            {
+                _sql_text(keyword): frozenset(_sql_text(flag) for flag in flags)
+                for keyword, flags in cls.FLAGGABLE_KEYWORDS.items()
+            }
+        )
+        cls.SUBQUERY_KEYWORDS = frozenset(
+            _sql_text(keyword) for keyword in cls.SUBQUERY_KEYWORDS
+        )
+        cls.JOIN_ALIASES = MappingProxyType(
+            {
+                _sql_text(join_type): _sql_text(clause)
+                for join_type, clause in cls.JOIN_ALIASES.items()
+            }
+        )
+
+    @classmethod
+    def _compile_layout(cls) -> None:
+        """Bind each keyword to its separator once, instead of on every build."""
+        cls._CLAUSE_LAYOUT = tuple(
+            (keyword, cls.CLAUSE_SEPARATORS.get(keyword, cls.DEFAULT_SEPARATOR))
+            for keyword in KEYWORDS
+        )
+        separators = dict(cls._CLAUSE_LAYOUT)
+        cls._SELECT_FROM_SEPARATORS = (
+            separators[SQLKeyword.SELECT.value],
+            separators[SQLKeyword.FROM.value],
+        )
+
+    def __init__(self) -> None:
+        """Initialize a new query builder."""
+        # Clause collections are created on first use; most queries touch only
+        # a few of the supported clauses
+        self._clauses: Dict[str, ClauseCollection] = {}
+        self._cached_sql: Optional[str] = None
+
+    @classmethod
+    def from_spec(
+        cls,
+        *,
+        with_: ClauseElements = (),
+        select: ClauseElements = (),
+        from_: ClauseElements = (),
+        joins: Sequence[Tuple[str, str]] = (),
+        where: ClauseElements = (),
+        group_by: ClauseElements = (),
+        having: ClauseElements = (),
+        order_by: ClauseElements = (),
+        limit: Optional[Union[int, str]] = None,
+    ) -> "Query":
+        """
+        Create a query from keyword arguments in a single call.
+
+        Each clause argument is a list or tuple of the elements its fluent
+        method accepts, so an ``(alias, value)`` pair must be nested, as in
+        ``select=[("full_name", "name")]``. A bare string is a single element.
+        ``joins`` likewise holds ``(join_type, condition)`` pairs, such as
+        ``joins=[("LEFT JOIN", "p ON ...")]``.
+
+        Returns:
+            A new query, equivalent to the matching chain of fluent calls
+        """
+        query = cls()
+        for clause_name, elements in (
+            (SQLKeyword.WITH.value, with_),
+            (SQLKeyword.SELECT.value, select),
+            (SQLKeyword.FROM.value, from_),
+            (SQLKeyword.WHERE.value, where),
+            (SQLKeyword.GROUP_BY.value, group_by),
+            (SQLKeyword.HAVING.value, having),
+            (SQLKeyword.ORDER_BY.value, order_by),
+        ):
+            if elements:
+                if isinstance(elements, str):
+                    elements = [elements]
+                query.add(clause_name, *elements)
+
+        for join in joins:
+            if not (
+                isinstance(join, (list, tuple))
+                and len(join) == 2
+                and isinstance(join[0], str)
+            ):
+                raise ValueError(
+                    f"Invalid join format: {join!r}; "
+                    "expected (join_type, condition) pairs"
+                )
+            query.add(join[0], join[1])
+
+        if limit is not None:
+            query.add(SQLKeyword.LIMIT.value, str(limit))
+
+        return query
+
+    def add(self, clause_name: str, *args: Union[str, tuple]) -> "Query":
         """
         Add elements to a SQL clause.
 
@@ -126,72 +398,92 @@ class Query:
         Returns:
             Self for method chaining
         """
-        # Handle JOIN aliases
-        actual_clause, join_keyword = self._resolve_join_alias(clause_name)
+        resolved = self._RESOLVED_CLAUSES.get(clause_name)
+        if resolved is None:
+            resolved = self._resolve_clause(clause_name)
+        actual_clause, join_keyword, flag, is_subquery = resolved
 
-        # Handle flags (e.g., "SELECT DISTINCT")
-        actual_clause, flag = self._parse_flag(actual_clause)
+        clause_collection = self._clauses.get(actual_clause)
+        if clause_collection is None:
+            clause_collection = self._clauses[actual_clause] = ClauseCollection()
 
-        # Get the SQL keyword enum
-        try:
-            keyword = SQLKeyword(actual_clause)
-        except ValueError as e:
-            raise ValueError(f"Unsupported SQL clause: {actual_clause}") from e
-
-        clause_collection = self._clauses[keyword]
+        # Any mutation invalidates the previously built SQL
+        self._cached_sql = None
 
         # Set flag if present
         if flag:
             clause_collection.set_flag(flag)
 
-        # Add elements to the clause
+        # Add elements to the clause, rendering each one once up front
+        create = QueryElement.create
+        add_element = clause_collection.add_element
         for arg in args:
-            kwargs = {}
-            if join_keyword:
-                kwargs["join_keyword"] = join_keyword
-            if keyword in self.SUBQUERY_KEYWORDS:
-                kwargs["is_subquery"] = True
-
-            element = QueryElement.create(arg, **kwargs)
-            clause_collection.add_element(element)
+            if type(arg) is str and not is_subquery:
+                # Inlined fast path of QueryElement.create for plain strings
+                add_element(QueryElement(_normalize_str(arg), "", join_keyword, False))
+            else:
+                add_element(create(arg, join_keyword, is_subquery))
 
         return self
 
+    def _resolve_clause(self, clause_name: str) -> Tuple[str, str, str, bool]:
+        """Resolve a clause name passed to add() and remember the result."""
+        # Handle JOIN aliases
+        actual_clause, join_keyword = self._resolve_join_alias(clause_name)
+
+        # Handle flags (e.g., "SELECT DISTINCT")
+        actual_clause, flag = self._parse_flag(actual_clause)
+
+        if actual_clause not in _KEYWORD_SET:
+            raise ValueError(f"Unsupported SQL clause: {actual_clause}")
+
+        # Interned names let the _clauses lookups in add() and build() match
+        # by identity, whichever spelling the clause was first added with
+        resolved = (
+            sys.intern(actual_clause),
+            sys.intern(join_keyword),
+            flag,
+            actual_clause in self.SUBQUERY_KEYWORDS,
+        )
+        self._RESOLVED_CLAUSES[clause_name] = resolved
+        return resolved
+
     def _resolve_join_alias(self, clause_name: str) -> tuple[str, str]:
         """Resolve JOIN aliases to their actual clause and extract join type."""
-        for join_type, actual_clause in self.JOIN_ALIASES.items():
-            if join_type in clause_name:
-                return actual_clause, clause_name
+        actual_clause = self.JOIN_ALIASES.get(clause_name)
+        if actual_clause is not None:
+            return actual_clause, clause_name
+
+        # Variants such as "LEFT OUTER JOIN" still resolve by substring; plain
+        # single-word clauses like "SELECT" never need the scan.
+        if " " in clause_name:
+            for join_type, actual_clause in self.JOIN_ALIASES.items():
+                if join_type in clause_name:
+                    return actual_clause, clause_name
         return clause_name, ""
 
     def _parse_flag(self, clause_name: str) -> tuple[str, str]:
         """Parse flags from clause names.
         Example: 'SELECT DISTINCT' -> 'SELECT', 'DISTINCT'
         """
+        space = clause_name.find(" ")
+        if space > 0:
+            base_clause, potential_flag = clause_name[:space], clause_name[space + 1 :]
+            if potential_flag in self.FLAGGABLE_KEYWORDS.get(base_clause, ()):
+                return base_clause, potential_flag
+
+        # Tabs, repeated or surrounding whitespace: compare the words instead.
+        # Trailing words after the flag (e.g. "SELECT DISTINCT ON") don't match.
         parts = clause_name.split()
-        if len(parts) == 1:
-            return clause_name, ""
-
-        base_clause, potential_flag = parts[0], parts[1]
-
-        try:
-            keyword = SQLKeyword(base_clause)
-            if keyword in self.FLAGGABLE_KEYWORDS:
-                try:
-                    flag = SQLFlag(potential_flag)
-                    if flag in self.FLAGGABLE_KEYWORDS[keyword]:
-                        return base_clause, potential_flag
-                except ValueError:
-                    pass
-        except ValueError:
-            pass
+        if len(parts) == 2 and parts[1] in self.FLAGGABLE_KEYWORDS.get(parts[0], ()):
+            return parts[0], parts[1]
 
         return clause_name, ""
 
-    def __getattr__(self, name: str):
-        """Enable fluent interface for SQL clauses (e.g., query.SELECT(...))."""
-        if name.isupper():
-            clause_name = name.replace("_", " ")
+    def __getattr__(self, name: str) -> Callable[..., "Query"]:
+        """Fallback fluent dispatch for clause names without a generated method."""
+        clause_name = _method_to_clause(name)
+        if clause_name is not None:
             return lambda *args: self.add(clause_name, *args)
         raise AttributeError(
             f"'{type(self).__name__}' object has no attribute '{name}'"
@@ -199,80 +491,310 @@ class Query:
 
     def build(self) -> str:
         """Build and return the complete SQL query string."""
-        sql_parts = []
+        if self._cached_sql is None:
+            clauses = self._clauses
+            if not clauses:
+                # Nothing has been added yet; skip walking the clause layout
+                return ""
+            if len(clauses) == 2:
+                sql = self._build_select_from(clauses)
+                if sql is not None:
+                    self._cached_sql = sql
+                    return sql
+            lines: List[str] = []
+            for keyword, separator in self._CLAUSE_LAYOUT:
+                clause = clauses.get(keyword)
+                if clause is not None and clause._rendered:
+                    self._render_clause(keyword, separator, clause, lines)
+            self._cached_sql = "\n".join(lines)
+        return self._cached_sql
+
+    def _build_select_from(self, clauses: Dict[str, ClauseCollection]) -> Optional[str]:
+        """Build a plain ``SELECT ... FROM ...`` query in one step.
+
+        Returns None for any other shape (flags, JOINs, multi-line or empty
+        bodies), which build() then renders through the general path.
+        """
+        select = clauses.get(SQLKeyword.SELECT.value)
+        from_ = clauses.get(SQLKeyword.FROM.value)
+        if (
+            select is None
+            or from_ is None
+            or not select._rendered
+            or not from_._rendered
+            or select.flag
+            or from_.has_joins
+        ):
+            return None
+
+        select_separator, from_separator = self._SELECT_FROM_SEPARATORS
+        select_body = select_separator.join(select._rendered)
+        from_body = from_separator.join(from_._rendered)
+        if not select_body or not from_body or "\n" in select_body or "\n" in from_body:
+            return None
+
+        return f"SELECT\n{INDENT}{select_body}\nFROM\n{INDENT}{from_body}"
+
+    def _render_clause(
+        self, keyword: str, separator: str, clause: ClauseCollection, lines: List[str]
+    ) -> None:
+        """Append one clause's header line and indented body lines to ``lines``."""
+        # Add the keyword and optional flag
+        lines.append(f"{keyword} {clause.flag}" if clause.flag else keyword)
+
+        # Group elements by join type for proper formatting; clauses without
+        # JOINs (the common case) are rendered as a single group
+        join_groups: Iterable[Tuple[str, List[str]]]
+        if clause.has_joins:
+            join_groups = self._group_rendered_by_join(clause).items()
+        else:
+            join_groups = (("", clause._rendered),)
 
-        for keyword in SQLKeyword:
-            clause = self._clauses[keyword]
-            if clause.is_empty():
-                continue
+        for join_keyword, rendered in join_groups:
+            if join_keyword:
+                lines.append(join_keyword)
+
+            joined_elements = separator.join(rendered)
 
-            # Add the keyword and optional flag
-            if clause.flag:
-                sql_parts.append(f"{keyword.value} {clause.flag}")
+            # Most bodies are a single line; only multi-line ones (subqueries,
+            # multi-line conditions) need the per-line indent helper.
+            if "\n" in joined_elements:
+                lines.append(_indent_text(joined_elements))
+            elif joined_elements:
+                lines.append(INDENT + joined_elements)
             else:
-                sql_parts.append(keyword.value)
+                lines.append(joined_elements)
 
-            # Group elements by join type for proper formatting
-            join_groups = self._group_elements_by_join(clause.elements)
+    def _group_rendered_by_join(self, clause: ClauseCollection) -> Dict[str, List[str]]:
+        """Group rendered elements by their join keywords for proper formatting."""
+        groups: Dict[str, List[str]] = defaultdict(list)
+        groups[""] = []  # Default group for non-JOIN elements, always rendered first
 
-            for join_keyword, elements in join_groups.items():
-                if join_keyword:
-                    sql_parts.append(join_keyword)
+        for element, rendered in zip(clause, clause._rendered):
+            groups[element.join_keyword].append(rendered)
 
-                # Format elements in this group
-                formatted_elements = []
-                for element in elements:
-                    formatted = self._format_element(keyword, element)
-                    formatted_elements.append(formatted)
+        return groups
 
-                # Join elements with appropriate separator
-                separator = self.CLAUSE_SEPARATORS.get(keyword, self.DEFAULT_SEPARATOR)
-                joined_elements = separator.join(formatted_elements)
-                sql_parts.append(_indent_text(joined_elements))
+    def copy(self) -> "Query":
+        """
+        Return an independent copy of this query.
 
-        return "\n".join(sql_parts)
+        Chained methods mutate and return the same query, so branch from a
+        shared base by copying it first. Elements are shared between the
+        copies, and so is the built SQL until either copy changes.
 
-    def _group_elements_by_join(
-        self, elements: List[QueryElement]
-    ) -> Dict[str, List[QueryElement]]:
-        """Group elements by their join keywords for proper formatting."""
-        groups = {"": []}  # Default group for non-JOIN elements
+        Returns:
+            A new query with the same clauses
+        """
+        clone = type(self)()
+        clone._clauses = {name: clause.copy() for name, clause in self._clauses.items()}
+        clone._cached_sql = self._cached_sql
+        return clone
 
-        for element in elements:
-            join_key = element.join_keyword
-            if join_key not in groups:
-                groups[join_key] = []
-            groups[join_key].append(element)
+    def freeze(self, *placeholders: str) -> "QueryTemplate":
+        """
+        Build the query once and return a reusable template.
 
-        return groups
+        Args:
+            *placeholders: Names of ``:name`` tokens in the query to substitute
 
-    def _format_element(self, keyword: SQLKeyword, element: QueryElement) -> str:
-        """Format a single query element based on the clause type."""
-        value = element.value
+        Returns:
+            A QueryTemplate that renders the SQL with the given values, or
+            passes them to the driver as bind parameters via bind()
+        """
+        return _make_template(self.build(), placeholders)
 
-        # Handle subqueries
-        if element.is_subquery:
-            value = f"(\n{_indent_text(value)}\n)"
+    def __str__(self) -> str:
+        """Return the built SQL query."""
+        return self.build()
 
-        # Handle aliases
-        if element.alias:
-            if keyword == SQLKeyword.WITH:
-                return f"{element.alias} AS {value}"
-            else:
-                return f"{value} AS {element.alias}"
 
-        return value
+class QueryTemplate:
+    """
+    A built SQL string with named ``:placeholder`` tokens.
+
+    Calling the template substitutes the values without rebuilding the query.
+    Values are inserted verbatim, exactly like the SQL fragments passed to Query,
+    so they must be trusted SQL literals and never user input. Use bind() to
+    pass values to the database driver as bind parameters instead.
+
+    Usage:
+        template = Query().SELECT("*").FROM("users").WHERE("id = :id").freeze("id")
+        template(id=42)  # "SELECT\n    *\nFROM\n    users\nWHERE\n    id = 42"
+        sql, params = template.bind({"id": user_id}, paramstyle="qmark")
+        cursor.execute(sql, params)
+
+    Templates are read-only, as freeze() shares one instance between every
+    query that builds to the same SQL.
+    """
+
+    __slots__ = ("_sql", "_placeholders", "_chunks")
+
+    def __init__(self, sql: str, placeholders: Tuple[str, ...]) -> None:
+        self._sql = sql
+        self._placeholders = placeholders
+
+        # Odd indices hold placeholder names, even indices the SQL between them
+        self._chunks: Tuple[str, ...]
+        if placeholders:
+            names = "|".join([re.escape(name) for name in placeholders])
+            self._chunks = tuple(re.split(rf"(?<!:):({names})\b", sql))
+        else:
+            self._chunks = (sql,)
+
+        missing = set(placeholders).difference(self._chunks[1::2])
+        if missing:
+            raise ValueError(f"Placeholders not found in query: {sorted(missing)}")
+
+    def __call__(self, **params: object) -> str:
+        """Return the SQL with each placeholder replaced by its value.
+
+        Values are not escaped or quoted; pass only trusted SQL literals.
+        """
+        missing = set(self._placeholders).difference(params)
+        if missing:
+            raise ValueError(f"Missing values for placeholders: {sorted(missing)}")
+
+        chunks = list(self._chunks)
+        for i in range(1, len(chunks), 2):
+            chunks[i] = str(params[chunks[i]])
+        return "".join(chunks)
+
+    def bind(
+        self, params: Mapping[str, object], *, paramstyle: str = "named"
+    ) -> Tuple[str, Union[Dict[str, object], Tuple[object, ...]]]:
+        """
+        Return the SQL and parameters to pass to a DB-API driver.
+
+        Placeholders are rewritten to the driver's bind markers, so values
+        are sent to the database separately and never spliced into the SQL.
+
+        Args:
+            params: Value for each placeholder
+            paramstyle: The driver's ``paramstyle``; one of "named",
+                "pyformat", "qmark" or "format"
+
+        Returns:
+            The SQL and the values, as a dict for the named styles or a tuple
+            in placeholder order for the positional ones
+        """
+        marker = _PARAMSTYLES.get(paramstyle)
+        if marker is None:
+            raise ValueError(
+                f"Unsupported paramstyle: {paramstyle!r}; "
+                f"expected one of {sorted(_PARAMSTYLES)}"
+            )
+        missing = set(self._placeholders).difference(params)
+        if missing:
+            raise ValueError(f"Missing values for placeholders: {sorted(missing)}")
+
+        chunks = list(self._chunks)
+        if "%" in marker:
+            # Literal percent signs would be read as markers by the driver
+            chunks[::2] = [chunk.replace("%", "%%") for chunk in chunks[::2]]
+        names = chunks[1::2]
+        chunks[1::2] = [marker.format(name) for name in names]
+        sql = "".join(chunks)
+
+        if "{}" in marker:
+            return sql, {name: params[name] for name in self._placeholders}
+        return sql, tuple(params[name] for name in names)
+
+    @property
+    def sql(self) -> str:
+        """The SQL with placeholders left in place."""
+        return self._sql
+
+    @property
+    def placeholders(self) -> Tuple[str, ...]:
+        """The placeholder names substituted by calling the template."""
+        return self._placeholders
 
     def __str__(self) -> str:
-        """Return the built SQL query."""
-        return self.build()
+        """Return the SQL with placeholders left in place."""
+        return self._sql
+
+
+@lru_cache(maxsize=256)
+def _make_template(sql: str, placeholders: Tuple[str, ...]) -> QueryTemplate:
+    """Create a template, shared by every query that builds to the same SQL."""
+    return QueryTemplate(sql, placeholders)
+
+
+def _make_clause_method(clause_name: str) -> Callable[..., Query]:
+    """Create a fluent method that adds elements to ``clause_name``."""
+
+    def method(self: Query, *args: Union[str, tuple]) -> Query:
+        return self.add(clause_name, *args)
+
+    method.__name__ = clause_name.replace(" ", "_")
+    method.__qualname__ = f"Query.{method.__name__}"
+    method.__doc__ = f"Add elements to the {clause_name} clause."
+    return method
+
+
+def _install_clause_methods() -> None:
+    """Generate fluent methods (SELECT, LEFT_JOIN, ...) on the Query class.
+
+    Real methods are resolved through the normal attribute lookup, so the
+    common clauses never fall through to ``Query.__getattr__``.
+    """
+    clause_names = list(KEYWORDS)
+    clause_names.extend(Query.JOIN_ALIASES)
+    for keyword, flags in Query.FLAGGABLE_KEYWORDS.items():
+        clause_names.extend(f"{keyword} {flag}" for flag in sorted(flags))
+
+    for clause_name in clause_names:
+        method = _make_clause_method(clause_name)
+        setattr(Query, method.__name__, method)
+
+
+_install_clause_methods()
+Query._compile_layout()
+
+
+def _sql_text(keyword: Union[str, Enum]) -> str:
+    """Return the SQL text of a keyword or flag given as a string or enum member."""
+    return keyword.value if isinstance(keyword, Enum) else keyword
+
+
+@lru_cache(maxsize=256)
+def _method_to_clause(name: str) -> Optional[str]:
+    """Translate a fluent method name to its clause name, or None if invalid."""
+    return name.replace("_", " ") if name.isupper() else None
 
 
 def _normalize_sql(text: str) -> str:
     """Normalize SQL text by removing extra whitespace and formatting."""
-    return textwrap.dedent(str(text).rstrip()).strip()
+    if type(text) is not str:
+        text = str(text)
+    return _normalize_str(text)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_str(text: str) -> str:
+    """Cached normalization; identifiers and conditions recur across queries."""
+    if "\n" not in text:
+        # Nothing to dedent on a single line
+        text = text.strip()
+        if len(text) <= _MAX_INTERNED_LENGTH and _IDENTIFIER_RE.fullmatch(text):
+            # Identifiers ("users", "u.id") recur everywhere; share one object
+            # even after they fall out of the LRU cache
+            return sys.intern(text)
+        return text
+    return textwrap.dedent(text.rstrip()).strip()
 
 
 def _indent_text(text: str, spaces: int = 4) -> str:
-    """Indent text with the specified number of spaces."""
-    return textwrap.indent(text, " " * spaces)
+    """Indent text with the specified number of spaces.
+
+    Blank lines are left unindented, matching ``textwrap.indent``.
+    """
+    pad = " " * spaces
+    if "\n\n" not in text:
+        # Normalized SQL has no whitespace-only lines, so without empty lines
+        # every line gets the prefix
+        return pad + text.replace("\n", "\n" + pad) if text.strip() else text
+    return "\n".join(
+        [pad + line if line.strip() else line for line in text.split("\n")]
+    )
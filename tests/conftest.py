@@ -31,3 +31,24 @@ def complex_query(query):
         .ORDER_BY("u.name")
         .LIMIT("10")
     )
+
+
+@pytest.fixture(scope="session")
+def full_complex_sql():
+    """Build the SQL for a query using every major clause, once per session.
+
+    The fixture yields the built string rather than the Query, so tests
+    sharing it cannot mutate each other's input.
+    """
+    return str(
+        Query()
+        .SELECT("u.name", "u.email", "COUNT(p.id) as post_count")
+        .FROM("users u")
+        .add("LEFT JOIN", "posts p ON u.id = p.user_id")
+        .WHERE("u.active = 1")
+        .WHERE("u.created_at > '2023-01-01'")
+        .GROUP_BY("u.id", "u.name", "u.email")
+        .HAVING("COUNT(p.id) > 0")
+        .ORDER_BY("post_count DESC", "u.name")
+        .LIMIT("50")
+    )
@@ -137,6 +137,21 @@ class TestErrorHandling:
         sql = str(query)
         assert "SELECT DISTINCT" in sql
 
+    def test_trailing_words_after_flag_raise_error(self):
+        """Test that words after a flag are not silently dropped."""
+        query = Query()
+
+        with pytest.raises(ValueError, match="Unsupported SQL clause"):
+            query.add("SELECT DISTINCT ON", "name")
+
+    def test_flag_separated_by_other_whitespace(self):
+        """Test that flags separated by tabs or repeated spaces are parsed."""
+        for clause_name in ("SELECT  DISTINCT", "SELECT\tDISTINCT", " SELECT ALL "):
+            query = Query().add(clause_name, "name").FROM("users")
+            flag = clause_name.split()[1]
+
+            assert str(query) == f"SELECT {flag}\n    name\nFROM\n    users"
+
     def test_method_name_edge_cases(self):
         """Test edge cases in method name handling."""
         query = Query()
@@ -206,6 +221,50 @@ class TestMemoryAndPerformance:
 
         assert sql1 == sql2 == sql3
 
+    def test_build_is_cached_until_mutation(self):
+        """Test that build() reuses its result until the query changes."""
+        query = Query().SELECT("*").FROM("users")
+
+        sql1 = query.build()
+        assert query.build() is sql1
+
+        query.WHERE("active = 1")
+        sql2 = query.build()
+        assert sql2 is not sql1
+        assert sql2.endswith("WHERE\n    active = 1")
+
+    def test_fallback_methods_invalidate_cached_build(self):
+        """Test that clauses added through __getattr__ also reset the cache."""
+        query = Query().SELECT("*").FROM("users u")
+        sql1 = str(query)
+
+        query.LEFT_OUTER_JOIN("posts p ON u.id = p.user_id")
+        sql2 = str(query)
+
+        assert "LEFT OUTER JOIN" not in sql1
+        assert "LEFT OUTER JOIN\n    posts p ON u.id = p.user_id" in sql2
+
+    def test_copy_branches_from_shared_base(self):
+        """Test that copies of a base query can be extended independently."""
+        base = Query().SELECT_DISTINCT("*").FROM("users u")
+        base_sql = str(base)
+
+        active = base.copy().WHERE("active = 1")
+        joined = base.copy().LEFT_JOIN("posts p ON u.id = p.user_id")
+
+        assert str(base) == base_sql
+        assert str(active) == base_sql + "\nWHERE\n    active = 1"
+        assert "LEFT JOIN" in str(joined) and "WHERE" not in str(joined)
+        assert "LEFT JOIN" not in str(active)
+
+    def test_query_instances_have_no_dict(self):
+        """Test that Query stores its state in slots rather than a __dict__."""
+        query = Query().SELECT("*").FROM("users")
+
+        assert not hasattr(query, "__dict__")
+        with pytest.raises(AttributeError):
+            query.extra = 1
+
     def test_deep_copy_behavior(self):
         """Test that queries don't interfere with each other."""
         # base_query = Query().SELECT("*").FROM("users")
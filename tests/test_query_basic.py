@@ -30,10 +30,18 @@ class TestQueryElement:
         element = QueryElement.create(
             "name", join_keyword="INNER JOIN", is_subquery=True
         )
-        assert element.value == "name"
+        assert element.value == "(\n    name\n)"  # Subqueries are stored wrapped
         assert element.join_keyword == "INNER JOIN"
         assert element.is_subquery is True
 
+    def test_sql_rendering(self):
+        """Test the rendered SQL text of elements."""
+        assert QueryElement.create("name").sql == "name"
+        assert QueryElement.create(("user_name", "name")).sql == "name AS user_name"
+
+        cte = QueryElement.create(("recent", "SELECT 1"), is_subquery=True)
+        assert cte.sql == "recent AS (\n    SELECT 1\n)"
+
     def test_invalid_argument_format(self):
         """Test that invalid argument formats raise ValueError."""
         with pytest.raises(ValueError, match="Invalid argument format"):
@@ -59,6 +67,28 @@ class TestClauseCollection:
         assert not clause.is_empty()
         assert len(clause) == 1
         assert element in clause
+        assert clause._rendered == ["name"]
+        assert clause.has_joins is False
+
+        clause.add_element(QueryElement.create("posts", join_keyword="LEFT JOIN"))
+        assert clause.has_joins is True
+
+    def test_elements_are_read_only(self):
+        """Test that elements can only be added through add_element()."""
+        query = Query().SELECT("a")
+        clause = query._clauses["SELECT"]
+
+        elements = clause.elements
+        assert list(elements) == [QueryElement.create("a")]
+        with pytest.raises(AttributeError):
+            clause.append(QueryElement.create("b"))
+        with pytest.raises(TypeError):
+            elements[0] = QueryElement.create("b")
+
+        # The view is not a copy, so it reflects elements added later
+        clause.add_element(QueryElement.create("b"))
+        assert [element.value for element in elements] == ["a", "b"]
+        assert clause._rendered == ["a", "b"]
 
     def test_set_flag(self):
         """Test setting flags on ClauseCollection."""
@@ -93,7 +123,13 @@ class TestQueryBasic:
         """Test Query class initialization."""
         query = Query()
         assert isinstance(query, Query)
-        assert all(keyword in query._clauses for keyword in SQLKeyword)
+        assert query._clauses == {}
+
+    def test_clauses_created_on_first_use(self):
+        """Test that only the clauses a query uses are allocated."""
+        query = Query().SELECT("*").FROM("users")
+
+        assert set(query._clauses) == {SQLKeyword.SELECT.value, SQLKeyword.FROM.value}
 
     def test_simple_select(self):
         """Test basic SELECT query."""
@@ -134,6 +170,14 @@ class TestQueryBasic:
         assert "WHERE" in sql
         assert "ORDER BY" in sql
 
+    def test_clause_methods_are_generated(self):
+        """Test that fluent clause methods are real methods on the class."""
+        for name in ("SELECT", "GROUP_BY", "SELECT_DISTINCT", "LEFT_JOIN"):
+            assert name in vars(Query)
+
+        query = Query().SELECT_DISTINCT("name").FROM("users")
+        assert str(query) == "SELECT DISTINCT\n    name\nFROM\n    users"
+
     def test_invalid_method_name_raises_error(self):
         """Test that invalid method names raise AttributeError."""
         query = Query()
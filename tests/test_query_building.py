@@ -2,7 +2,17 @@
 Tests for SQL query building and formatting.
 """
 
+import re
+
+import pytest
+
 from quickql import Query
+from quickql.builder import SQLFlag, SQLKeyword
+
+# Clause headers expected in the full complex query, matched in one scan
+_EXPECTED_CLAUSES = re.compile(
+    r"SELECT|FROM|LEFT JOIN|WHERE|GROUP BY|HAVING|ORDER BY|LIMIT"
+)
 
 
 class TestSelectQueries:
@@ -44,6 +54,18 @@ class TestSelectQueries:
         assert "SELECT DISTINCT" in sql
         assert "department" in sql
 
+    def test_select_from_shapes_render_consistently(self):
+        """Test two-clause SELECT/FROM queries that need the general layout."""
+        distinct = Query().SELECT_DISTINCT("name").FROM("users")
+        joined = Query().SELECT("u.name").FROM("users u").JOIN("posts p ON 1 = 1")
+        empty = Query().SELECT("").FROM("users")
+
+        assert str(distinct) == "SELECT DISTINCT\n    name\nFROM\n    users"
+        assert str(joined) == (
+            "SELECT\n    u.name\nFROM\n    users u\nJOIN\n    posts p ON 1 = 1"
+        )
+        assert str(empty) == "SELECT\n\nFROM\n    users"
+
 
 class TestFromQueries:
     """Test cases for FROM clauses."""
@@ -105,6 +127,66 @@ class TestWhereQueries:
             in sql
         )
 
+    def test_subclass_clause_separator(self):
+        """Test that subclasses can override how conditions are joined."""
+
+        class OrQuery(Query):
+            CLAUSE_SEPARATORS = {"WHERE": " OR "}
+
+        query = OrQuery().SELECT("*").FROM("users").WHERE("a = 1").WHERE("b = 2")
+
+        assert "WHERE\n    a = 1 OR b = 2" in str(query)
+        assert "a = 1 AND b = 2" in str(Query().WHERE("a = 1").WHERE("b = 2"))
+
+    def test_clause_separators_are_read_only(self):
+        """Test that separators cannot be changed on an existing class."""
+
+        class OrQuery(Query):
+            CLAUSE_SEPARATORS = {"WHERE": " OR "}
+
+        for cls in (Query, OrQuery):
+            with pytest.raises(TypeError):
+                cls.CLAUSE_SEPARATORS["WHERE"] = " XOR "
+
+        assert "a = 1 AND b = 2" in str(Query().WHERE("a = 1").WHERE("b = 2"))
+
+    def test_clause_resolution_config_is_read_only(self):
+        """Test that the config cached clause resolutions rely on is read-only."""
+        with pytest.raises(TypeError):
+            Query.JOIN_ALIASES["OUTER JOIN"] = "FROM"
+        with pytest.raises(TypeError):
+            Query.FLAGGABLE_KEYWORDS["SELECT"] = frozenset()
+        with pytest.raises(AttributeError):
+            Query.FLAGGABLE_KEYWORDS["SELECT"].add("TOP")
+        with pytest.raises(AttributeError):
+            Query.SUBQUERY_KEYWORDS.add("SELECT")
+
+        assert str(Query().SELECT_ALL("name")) == "SELECT ALL\n    name"
+
+    def test_subclass_config_keyed_by_enums(self):
+        """Test that subclass configuration may use SQLKeyword/SQLFlag members."""
+
+        class EnumQuery(Query):
+            CLAUSE_SEPARATORS = {SQLKeyword.WHERE: " OR "}
+            FLAGGABLE_KEYWORDS = {SQLKeyword.SELECT: {SQLFlag.DISTINCT}}
+            SUBQUERY_KEYWORDS = {SQLKeyword.WITH}
+
+        query = (
+            EnumQuery()
+            .WITH(("recent", "SELECT 1"))
+            .SELECT_DISTINCT("name")
+            .FROM("recent")
+            .WHERE("a = 1")
+            .WHERE("b = 2")
+        )
+
+        sql = str(query)
+        assert "recent AS (\n        SELECT 1\n    )" in sql
+        assert "SELECT DISTINCT\n    name" in sql
+        assert "WHERE\n    a = 1 OR b = 2" in sql
+        with pytest.raises(ValueError, match="Unsupported SQL clause"):
+            EnumQuery().add("SELECT ALL", "name")
+
 
 class TestJoinQueries:
     """Test cases for JOIN clauses."""
@@ -187,6 +269,18 @@ class TestJoinQueries:
         sql = str(query)
         assert "CROSS JOIN" in sql
 
+    def test_join_variant_not_in_aliases(self):
+        """Test that JOIN variants like LEFT OUTER JOIN still resolve to FROM."""
+        query = (
+            Query()
+            .SELECT("u.name", "p.title")
+            .FROM("users u")
+            .add("LEFT OUTER JOIN", "posts p ON u.id = p.user_id")
+        )
+
+        sql = str(query)
+        assert "LEFT OUTER JOIN\n    posts p ON u.id = p.user_id" in sql
+
 
 class TestOrderByQueries:
     """Test cases for ORDER BY clauses."""
@@ -314,32 +408,21 @@ class TestWithQueries:
 class TestComplexQueries:
     """Test cases for complex multi-clause queries."""
 
-    def test_full_complex_query(self):
+    def test_full_complex_query(self, full_complex_sql):
         """Test a complex query with all major clauses."""
-        query = (
-            Query()
-            .SELECT("u.name", "u.email", "COUNT(p.id) as post_count")
-            .FROM("users u")
-            .add("LEFT JOIN", "posts p ON u.id = p.user_id")
-            .WHERE("u.active = 1")
-            .WHERE("u.created_at > '2023-01-01'")
-            .GROUP_BY("u.id", "u.name", "u.email")
-            .HAVING("COUNT(p.id) > 0")
-            .ORDER_BY("post_count DESC", "u.name")
-            .LIMIT("50")
-        )
-
-        sql = str(query)
+        sql = full_complex_sql
 
         # Check all major clauses are present
-        assert "SELECT" in sql
-        assert "FROM" in sql
-        assert "LEFT JOIN" in sql
-        assert "WHERE" in sql
-        assert "GROUP BY" in sql
-        assert "HAVING" in sql
-        assert "ORDER BY" in sql
-        assert "LIMIT" in sql
+        assert set(_EXPECTED_CLAUSES.findall(sql)) == {
+            "SELECT",
+            "FROM",
+            "LEFT JOIN",
+            "WHERE",
+            "GROUP BY",
+            "HAVING",
+            "ORDER BY",
+            "LIMIT",
+        }
 
         # Check proper formatting
         assert "u.active = 1 AND u.created_at > '2023-01-01'" in sql
@@ -371,3 +454,164 @@ class TestComplexQueries:
         assert "WITH" in sql
         assert "recent_commenters AS" in sql
         assert "COUNT(*) as comment_count" in sql
+
+    def test_from_spec_matches_fluent_chain(self):
+        """Test that from_spec() builds the same SQL as the fluent chain."""
+        fluent = (
+            Query()
+            .SELECT("u.name", ("total", "COUNT(p.id)"))
+            .FROM("users u")
+            .LEFT_JOIN("posts p ON u.id = p.user_id")
+            .WHERE("u.active = 1")
+            .WHERE("p.published = 1")
+            .GROUP_BY("u.name")
+            .ORDER_BY("total DESC")
+            .LIMIT("10")
+        )
+        spec = Query.from_spec(
+            select=["u.name", ("total", "COUNT(p.id)")],
+            from_="users u",
+            joins=[("LEFT JOIN", "posts p ON u.id = p.user_id")],
+            where=["u.active = 1", "p.published = 1"],
+            group_by="u.name",
+            order_by="total DESC",
+            limit=10,
+        )
+
+        assert str(spec) == str(fluent)
+        assert str(Query.from_spec()) == ""
+
+    def test_from_spec_alias_pairs_are_nested(self):
+        """Test that tuples are element sequences and alias pairs are nested."""
+        spec = Query.from_spec(
+            with_=[("recent", "SELECT 1")],
+            select=[("full_name", "name")],
+            from_="recent",
+        )
+        fluent = (
+            Query()
+            .WITH(("recent", "SELECT 1"))
+            .SELECT(("full_name", "name"))
+            .FROM("recent")
+        )
+
+        assert str(spec) == str(fluent)
+        assert "recent AS (\n        SELECT 1\n    )" in str(spec)
+        assert "name AS full_name" in str(spec)
+
+        columns = Query.from_spec(select=("id", "name", "email"), from_="users")
+        assert "SELECT\n    id, name, email" in str(columns)
+
+    def test_from_spec_bare_join_pair_raises_error(self):
+        """Test that joins must be a sequence of (join_type, condition) pairs."""
+        with pytest.raises(ValueError, match="Invalid join format"):
+            Query.from_spec(from_="users u", joins=("LEFT JOIN", "p ON 1 = 1"))
+
+    def test_from_spec_lists_hold_several_elements(self):
+        """Test that lists mix plain and aliased elements."""
+        spec = Query.from_spec(select=["id", ("full_name", "name")], from_="users")
+
+        assert "id, name AS full_name" in str(spec)
+
+
+class TestQueryTemplates:
+    """Test cases for frozen query templates."""
+
+    def test_freeze_substitutes_placeholders(self):
+        """Test that a frozen query fills in named placeholders."""
+        template = (
+            Query()
+            .SELECT("*")
+            .FROM("users")
+            .WHERE("id = :user_id")
+            .WHERE("status = :status")
+            .freeze("user_id", "status")
+        )
+
+        assert template(user_id=1, status="'active'") == (
+            "SELECT\n    *\nFROM\n    users\nWHERE\n    id = 1 AND status = 'active'"
+        )
+        assert "id = 2 AND status = 'banned'" in template(user_id=2, status="'banned'")
+        assert str(template) == template.sql
+
+    def test_freeze_ignores_casts_and_longer_names(self):
+        """Test that '::' casts and longer names are not treated as placeholders."""
+        template = (
+            Query()
+            .SELECT("created_at::date")
+            .FROM("events")
+            .WHERE("id = :id")
+            .WHERE("parent_id = :id2")
+            .freeze("id")
+        )
+
+        sql = template(id=7)
+        assert "created_at::date" in sql
+        assert "id = 7 AND parent_id = :id2" in sql
+
+    def test_freeze_is_shared_for_identical_queries(self):
+        """Test that identical queries reuse the same template."""
+
+        def make():
+            return Query().SELECT("*").FROM("users").WHERE("id = :id").freeze("id")
+
+        assert make() is make()
+
+    def test_shared_template_is_read_only(self):
+        """Test that one holder of a shared template cannot change it for others."""
+        template = Query().SELECT("*").FROM("users").WHERE("id = :id").freeze("id")
+
+        for attribute, value in (("sql", "SELECT 1"), ("placeholders", ())):
+            with pytest.raises(AttributeError):
+                setattr(template, attribute, value)
+
+        assert template(id=7).endswith("WHERE\n    id = 7")
+
+    def test_freeze_unknown_placeholder_raises_error(self):
+        """Test that freezing with a placeholder absent from the SQL fails."""
+        query = Query().SELECT("*").FROM("users")
+
+        with pytest.raises(ValueError, match="Placeholders not found"):
+            query.freeze("id")
+
+    def test_missing_placeholder_value_raises_error(self):
+        """Test that calling a template without every value fails."""
+        template = Query().SELECT("*").FROM("users").WHERE("id = :id").freeze("id")
+
+        with pytest.raises(ValueError, match="Missing values"):
+            template()
+
+    def test_bind_returns_driver_parameters(self):
+        """Test that bind() leaves values out of the SQL for the driver."""
+        template = (
+            Query()
+            .SELECT("*")
+            .FROM("users")
+            .WHERE("name LIKE 'a%' AND (id = :id OR parent_id = :id)")
+            .WHERE("status = :status")
+            .freeze("id", "status")
+        )
+        params = {"id": "1; DROP TABLE users", "status": "active"}
+
+        sql, named = template.bind(params)
+        assert "id = :id OR parent_id = :id" in sql
+        assert named == params
+
+        sql, named = template.bind(params, paramstyle="pyformat")
+        assert "LIKE 'a%%' AND (id = %(id)s OR parent_id = %(id)s)" in sql
+        assert "status = %(status)s" in sql
+        assert named == params
+
+        sql, positional = template.bind(params, paramstyle="qmark")
+        assert "id = ? OR parent_id = ?" in sql
+        assert "DROP TABLE" not in sql
+        assert positional == ("1; DROP TABLE users", "1; DROP TABLE users", "active")
+
+    def test_bind_invalid_paramstyle_raises_error(self):
+        """Test that bind() rejects unknown paramstyles and missing values."""
+        template = Query().SELECT("*").FROM("users").WHERE("id = :id").freeze("id")
+
+        with pytest.raises(ValueError, match="Unsupported paramstyle"):
+            template.bind({"id": 1}, paramstyle="numeric")
+        with pytest.raises(ValueError, match="Missing values"):
+            template.bind({})